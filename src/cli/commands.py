@@ -1,14 +1,16 @@
 import argparse
 import os
-from ..core.structure_generator import StructureGenerator
+from functools import lru_cache
 # from ..core.database import DatabaseManager  # Comentado para desactivar DB
-# from ..templates.cli import setup_template_parser # Comentado para desactivar DB
 
 def create_project(args: argparse.Namespace) -> None:
     """
     Handles the core logic of creating a project structure.
     This version is simplified to work without a database.
     """
+    # Imported here so `--help` and argument errors don't pay for it
+    from ..core.structure_generator import StructureGenerator
+
     # --- DB-related logic is fully disabled ---
     # The generator is instantiated without a database manager.
     generator = StructureGenerator(db_manager=None, doc_format=args.format)
@@ -44,6 +46,7 @@ def create_project(args: argparse.Namespace) -> None:
 #             print(f"ID: {proj['id']}, Name: {proj['name']}, Updated: {proj['updated_at']}")
 
 # def generate_structure(args: argparse.Namespace) -> None:
+#     from ..core.structure_generator import StructureGenerator
 #     db_manager = DatabaseManager()
 #     generator = StructureGenerator(db_manager, doc_format=args.format)
 #     project = db_manager.get_project(args.id)
@@ -54,7 +57,9 @@ def create_project(args: argparse.Namespace) -> None:
 #     print(f"Structure generated at: {path}")
 
 
-def main() -> int:
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once; subcommand definitions don't depend on runtime state."""
     parser = argparse.ArgumentParser(description="Project Structure Manager CLI")
     subparsers = parser.add_subparsers(dest='command', help='Available commands', required=True)
 
@@ -76,8 +81,14 @@ def main() -> int:
     # gen_parser.add_argument('--format', choices=['md', 'pdf', 'img'], default='pdf', help='Format for documentation files (default: pdf)')
     # gen_parser.set_defaults(func=generate_structure)
     
+    # from ..templates.cli import setup_template_parser  # Comentado para desactivar DB
     # setup_template_parser(subparsers)
 
+    return parser
+
+
+def main() -> int:
+    parser = _build_parser()
     args = parser.parse_args()
     if hasattr(args, 'func'):
         try:
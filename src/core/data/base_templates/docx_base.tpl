@@ -0,0 +1,37 @@
+{{titulo}}
+
+{{empresa}}
+
+Fecha: {{fecha}} | Hora: {{hora}}
+
+ÍNDICE
+
+1. Introducción
+2. Objetivo
+3. Contenido
+4. Conclusiones
+
+INTRODUCCIÓN
+
+{{introduccion}}
+
+OBJETIVO
+
+{{objetivo}}
+
+CONTENIDO
+
+Elemento: {{elemento1}}
+Descripción: {{descripcion1}}
+Estado: {{estado1}}
+
+Elemento: {{elemento2}}
+Descripción: {{descripcion2}}
+Estado: {{estado2}}
+
+CONCLUSIONES
+
+{{conclusiones}}
+
+---
+Generado automáticamente por Project Manager | {{fecha}} {{hora}}
\ No newline at end of file
@@ -0,0 +1,32 @@
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>{{titulo}}</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        .header { background-color: #f8f9fa; padding: 20px; text-align: center; }
+        .content { margin: 20px 0; }
+        .footer { border-top: 1px solid #ddd; padding-top: 10px; font-size: 12px; color: #666; }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h2>{{titulo}}</h2>
+        <p><strong>{{empresa}}</strong></p>
+        <p>{{fecha}} | {{hora}}</p>
+    </div>
+
+    <div class="content">
+        <p>Estimado {{nombre}},</p>
+
+        <p>{{mensaje}}</p>
+
+        <p>Atentamente,<br>{{remitente}}</p>
+    </div>
+
+    <div class="footer">
+        <p>Generado automáticamente por Project Manager | {{fecha}} {{hora}}</p>
+    </div>
+</body>
+</html>
\ No newline at end of file
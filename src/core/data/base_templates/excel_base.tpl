@@ -0,0 +1,18 @@
+{
+  "titulo": "{{titulo}}",
+  "empresa": "{{empresa}}",
+  "fecha": "{{fecha}}",
+  "hora": "{{hora}}",
+  "seccion1": "Introducción",
+  "seccion2": "Objetivo",
+  "seccion3": "Contenido",
+  "seccion4": "Conclusiones",
+  "introduccion": "{{introduccion}}",
+  "objetivo": "{{objetivo}}",
+  "contenido": {
+    "Elemento": ["{{elemento1}}", "{{elemento2}}"],
+    "Descripción": ["{{descripcion1}}", "{{descripcion2}}"],
+    "Estado": ["{{estado1}}", "{{estado2}}"]
+  },
+  "conclusiones": "{{conclusiones}}"
+}
\ No newline at end of file
@@ -0,0 +1,153 @@
+<!DOCTYPE html>
+<html lang="es">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{titulo}}</title>
+    <style>
+        body {
+            font-family: Arial, sans-serif;
+            margin: 40px;
+            line-height: 1.6;
+        }
+        .header {
+            text-align: center;
+            border-bottom: 2px solid #333;
+            padding-bottom: 20px;
+            margin-bottom: 30px;
+        }
+        .title {
+            font-size: 24px;
+            font-weight: bold;
+            color: #333;
+        }
+        .subtitle {
+            font-size: 16px;
+            color: #666;
+            margin-top: 10px;
+        }
+        .date {
+            font-size: 14px;
+            color: #888;
+            margin-top: 5px;
+        }
+        .section {
+            margin: 30px 0;
+        }
+        .section-title {
+            font-size: 18px;
+            font-weight: bold;
+            color: #333;
+            margin-bottom: 15px;
+            border-left: 4px solid #007acc;
+            padding-left: 10px;
+        }
+        .content {
+            margin-left: 20px;
+        }
+        .table-of-contents {
+            background-color: #f5f5f5;
+            padding: 20px;
+            border-radius: 5px;
+            margin: 20px 0;
+        }
+        .toc-title {
+            font-weight: bold;
+            margin-bottom: 10px;
+        }
+        .toc-item {
+            margin: 5px 0;
+            padding-left: 15px;
+        }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            margin: 20px 0;
+        }
+        th, td {
+            border: 1px solid #ddd;
+            padding: 12px;
+            text-align: left;
+        }
+        th {
+            background-color: #f2f2f2;
+            font-weight: bold;
+        }
+        .footer {
+            margin-top: 50px;
+            padding-top: 20px;
+            border-top: 1px solid #ddd;
+            text-align: center;
+            font-size: 12px;
+            color: #666;
+        }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <div class="title">{{titulo}}</div>
+        <div class="subtitle">{{empresa}}</div>
+        <div class="date">Fecha: {{fecha}} | Hora: {{hora}}</div>
+    </div>
+
+    <div class="table-of-contents">
+        <div class="toc-title">Tabla de Contenido</div>
+        <div class="toc-item">1. Introducción</div>
+        <div class="toc-item">2. Objetivo</div>
+        <div class="toc-item">3. Contenido</div>
+        <div class="toc-item">4. Conclusiones</div>
+    </div>
+
+    <div class="section">
+        <div class="section-title">Introducción</div>
+        <div class="content">
+            <p>{{introduccion}}</p>
+        </div>
+    </div>
+
+    <div class="section">
+        <div class="section-title">Objetivo</div>
+        <div class="content">
+            <p>{{objetivo}}</p>
+        </div>
+    </div>
+
+    <div class="section">
+        <div class="section-title">Contenido</div>
+        <div class="content">
+            <table>
+                <thead>
+                    <tr>
+                        <th>Elemento</th>
+                        <th>Descripción</th>
+                        <th>Estado</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    <tr>
+                        <td>{{elemento1}}</td>
+                        <td>{{descripcion1}}</td>
+                        <td>{{estado1}}</td>
+                    </tr>
+                    <tr>
+                        <td>{{elemento2}}</td>
+                        <td>{{descripcion2}}</td>
+                        <td>{{estado2}}</td>
+                    </tr>
+                </tbody>
+            </table>
+        </div>
+    </div>
+
+    <div class="section">
+        <div class="section-title">Conclusiones</div>
+        <div class="content">
+            <p>{{conclusiones}}</p>
+        </div>
+    </div>
+
+    <div class="footer">
+        <p>Generado automáticamente por Project Manager | {{fecha}} {{hora}}</p>
+    </div>
+</body>
+</html>
\ No newline at end of file
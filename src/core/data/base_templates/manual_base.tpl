@@ -0,0 +1,52 @@
+# {{titulo}}
+
+**Manual de {{tipo}}**
+
+*{{empresa}}*
+
+*Versión: {{version}} | Fecha: {{fecha}} | Hora: {{hora}}*
+
+---
+
+## Tabla de Contenido
+
+1. [Introducción](#introducción)
+2. [Objetivos](#objetivos)
+3. [Procedimientos](#procedimientos)
+4. [Anexos](#anexos)
+
+---
+
+## Introducción
+
+### Propósito
+{{proposito}}
+
+### Alcance
+{{alcance}}
+
+### Responsabilidades
+{{responsabilidades}}
+
+## Objetivos
+
+{{objetivos}}
+
+## Procedimientos
+
+### Procedimiento 1: {{procedimiento1}}
+{{descripcion1}}
+
+### Procedimiento 2: {{procedimiento2}}
+{{descripcion2}}
+
+## Anexos
+
+- Anexo 1: {{anexo1}}
+- Anexo 2: {{anexo2}}
+
+---
+
+*Este manual fue generado automáticamente por Project Manager*
+
+*{{empresa}} | {{fecha}} | {{hora}}*
\ No newline at end of file
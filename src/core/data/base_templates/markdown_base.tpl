@@ -0,0 +1,39 @@
+# {{titulo}}
+
+**{{empresa}}**
+
+*Fecha: {{fecha}} | Hora: {{hora}}*
+
+---
+
+## Tabla de Contenido
+
+1. [Introducción](#introducción)
+2. [Objetivo](#objetivo)
+3. [Contenido](#contenido)
+4. [Conclusiones](#conclusiones)
+
+---
+
+## Introducción
+
+{{introduccion}}
+
+## Objetivo
+
+{{objetivo}}
+
+## Contenido
+
+| Elemento | Descripción | Estado |
+|----------|-------------|--------|
+| {{elemento1}} | {{descripcion1}} | {{estado1}} |
+| {{elemento2}} | {{descripcion2}} | {{estado2}} |
+
+## Conclusiones
+
+{{conclusiones}}
+
+---
+
+*Generado automáticamente por Project Manager | {{fecha}} {{hora}}*
\ No newline at end of file
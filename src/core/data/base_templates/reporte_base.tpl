@@ -0,0 +1,18 @@
+{
+  "titulo": "{{titulo}}",
+  "empresa": "{{empresa}}",
+  "fecha": "{{fecha}}",
+  "hora": "{{hora}}",
+  "seccion1": "Resumen Ejecutivo",
+  "seccion2": "Metodología",
+  "seccion3": "Resultados",
+  "seccion4": "Recomendaciones",
+  "introduccion": "{{introduccion}}",
+  "objetivo": "{{objetivo}}",
+  "contenido": {
+    "Métrica": ["{{metrica1}}", "{{metrica2}}", "{{metrica3}}"],
+    "Valor": ["{{valor1}}", "{{valor2}}", "{{valor3}}"],
+    "Estado": ["{{estado1}}", "{{estado2}}", "{{estado3}}"]
+  },
+  "conclusiones": "{{conclusiones}}"
+}
\ No newline at end of file
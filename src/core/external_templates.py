@@ -5,16 +5,50 @@ Supports multi-sheet Excel templates and other formats.
 """
 
 import os
+import re
+import copy
 import json
-from typing import Dict, List, Any, Optional
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+# Optional C-accelerated JSON; orjson.JSONDecodeError subclasses
+# json.JSONDecodeError and both encoders write the same indented UTF-8
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _read_summary(path_str: str) -> Tuple[Optional[str], str]:
+    """Return (name, description) of a template file; name is None if missing."""
+    with open(path_str, 'rb') as f:
+        data = _json_loads(f.read())
+    return data.get('name'), data.get('description', '')
+
+
 class ExternalTemplateLoader:
     """Loads and manages external templates from JSON files."""
 
+    __slots__ = ('templates_dir', '_list_cache')
+
     def __init__(self, templates_dir: str = "templates"):
+        # Created on the first save; reads treat a missing directory as empty
         self.templates_dir = Path(templates_dir)
-        self.templates_dir.mkdir(exist_ok=True)
+        # file path -> ((mtime_ns, size), listing entry); see _iter_extension
+        self._list_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, str]]] = {}
 
     def get_template_path(self, template_name: str, extension: str) -> Optional[Path]:
         """Get the path to an external template file."""
@@ -23,268 +57,297 @@ class ExternalTemplateLoader:
 
     def load_template(self, template_name: str, extension: str) -> Optional[Dict[str, Any]]:
         """Load an external template by name and extension."""
-        template_path = self.get_template_path(template_name, extension)
-        if not template_path:
+        template_path = self.templates_dir / extension / f"{template_name}.json"
+        try:
+            return _json_loads(template_path.read_bytes())
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            logger.warning("Failed to load external template %s.%s: %s", template_name, extension, e)
             return None
 
+    def _template_files(self, extension: str) -> List[os.DirEntry]:
+        """Template JSON files of one extension, using scandir's cached file types."""
         try:
-            with open(template_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError, UnicodeDecodeError) as e:
-            print(f"Warning: Failed to load external template {template_name}.{extension}: {e}")
-            return None
+            with os.scandir(os.path.join(self.templates_dir, extension)) as entries:
+                return [entry for entry in entries if entry.name.endswith('.json') and entry.is_file()]
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+
+    def clear_cache(self) -> None:
+        """Drop cached listings."""
+        self._list_cache.clear()
 
     def list_templates(self, extension: Optional[str] = None) -> List[Dict[str, str]]:
         """List all available external templates."""
-        templates = []
+        return list(self.iter_templates(extension))
 
+    def iter_templates(self, extension: Optional[str] = None) -> Iterator[Dict[str, str]]:
+        """Yield external templates one at a time; stopping early skips the remaining files."""
         if extension:
-            template_dir = self.templates_dir / extension
-            if template_dir.exists():
-                for template_file in template_dir.glob("*.json"):
-                    try:
-                        with open(template_file, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                        templates.append({
-                            'name': data.get('name', template_file.stem),
-                            'extension': extension,
-                            'description': data.get('description', ''),
-                            'file': str(template_file)
-                        })
-                    except Exception:
-                        continue
+            extensions = [extension]
         else:
-            for ext_dir in self.templates_dir.iterdir():
-                if ext_dir.is_dir():
-                    for template_file in ext_dir.glob("*.json"):
-                        try:
-                            with open(template_file, 'r', encoding='utf-8') as f:
-                                data = json.load(f)
-                            templates.append({
-                                'name': data.get('name', template_file.stem),
-                                'extension': ext_dir.name,
-                                'description': data.get('description', ''),
-                                'file': str(template_file)
-                            })
-                        except Exception:
-                            continue
-
-        return templates
+            try:
+                with os.scandir(self.templates_dir) as entries:
+                    extensions = [entry.name for entry in entries if entry.is_dir()]
+            except FileNotFoundError:
+                return
+
+        for ext in extensions:
+            for template in self._iter_extension(ext):
+                yield dict(template)
+
+    def _iter_extension(self, extension: str) -> Iterator[Dict[str, str]]:
+        """Listing of one extension directory; a file is read again only once its stat changes."""
+        for entry in self._template_files(extension):
+            try:
+                # In-place edits keep the directory's mtime but not the file's
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            key = (stat.st_mtime_ns, stat.st_size)
+            cached = self._list_cache.get(entry.path)
+            if cached and cached[0] == key:
+                yield cached[1]
+                continue
+
+            try:
+                name, description = _read_summary(entry.path)
+            except Exception:
+                continue
+            template = {
+                'name': entry.name[:-len('.json')] if name is None else name,
+                'extension': extension,
+                'description': description,
+                'file': entry.path
+            }
+            self._list_cache[entry.path] = (key, template)
+            yield template
 
     def save_template(self, template_data: Dict[str, Any], extension: str) -> bool:
         """Save a template to external file."""
         template_dir = self.templates_dir / extension
-        template_dir.mkdir(exist_ok=True)
+        template_dir.mkdir(parents=True, exist_ok=True)
 
         template_name = template_data.get('name', 'unnamed_template')
         template_file = template_dir / f"{template_name}.json"
 
+        # Written next to the target and renamed over it, so readers never see
+        # a partial file; pid and thread keep concurrent writers apart
+        tmp_file = template_dir / f"{template_file.name}.tmp.{os.getpid()}.{threading.get_ident()}"
         try:
-            with open(template_file, 'w', encoding='utf-8') as f:
-                json.dump(template_data, f, indent=2, ensure_ascii=False)
+            with open(tmp_file, 'wb') as f:
+                f.write(_json_dumps(template_data))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, template_file)
+            # Saves within the mtime granularity keep the same cache keys
+            self.clear_cache()
             return True
         except Exception as e:
-            print(f"Error saving template {template_name}.{extension}: {e}")
+            tmp_file.unlink(missing_ok=True)
+            logger.error("Error saving template %s.%s: %s", template_name, extension, e)
             return False
 
     def delete_template(self, template_name: str, extension: str) -> bool:
         """Delete an external template."""
-        template_path = self.get_template_path(template_name, extension)
-        if template_path and template_path.exists():
-            try:
-                template_path.unlink()
-                return True
-            except Exception as e:
-                print(f"Error deleting template {template_name}.{extension}: {e}")
-                return False
-        return False
-
-def create_excel_multi_sheet_template() -> Dict[str, Any]:
-    """Create a multi-sheet Excel template example."""
-    return {
-        "name": "Multi-Sheet Dashboard",
-        "extension": "xlsx",
-        "description": "Excel template with data, summary, and dashboard sheets",
-        "version": "1.0",
-        "author": "Project Manager",
-        "sheets": {
-            "Data": {
-                "description": "Raw data input sheet",
-                "cells": {
-                    "A1": {
-                        "value": "📊 {{titulo}}",
-                        "style": {
-                            "bold": True,
-                            "font_size": 16,
-                            "font_color": "1F4E79",
-                            "fill": {"pattern": "solid", "color": "E6F3FF"}
-                        }
-                    },
-                    "A2": {
-                        "value": "{{empresa}}",
-                        "style": {"italic": True, "font_size": 12}
-                    },
-                    "A3": {
-                        "value": "Fecha: {{fecha}} | Hora: {{hora}}",
-                        "style": {"font_size": 10, "font_color": "666666"}
-                    },
-                    "A5": {
-                        "value": "📋 DATOS PRINCIPALES",
-                        "style": {
-                            "bold": True,
-                            "font_size": 14,
-                            "fill": {"pattern": "solid", "color": "F2F2F2"}
-                        }
-                    },
-                    "B7": {"value": "{{metrica1}}"},
-                    "C7": {"value": "{{metrica2}}"},
-                    "D7": {"value": "{{metrica3}}"},
-                    "B8": {"value": "{{valor1}}", "style": {"bold": True}},
-                    "C8": {"value": "{{valor2}}", "style": {"bold": True}},
-                    "D8": {"value": "{{valor3}}", "style": {"bold": True}},
-                    "B9": {"value": "{{estado1}}", "style": {"font_color": "28A745"}},
-                    "C9": {"value": "{{estado2}}", "style": {"font_color": "28A745"}},
-                    "D9": {"value": "{{estado3}}", "style": {"font_color": "28A745"}}
+        template_path = self.templates_dir / extension / f"{template_name}.json"
+        try:
+            template_path.unlink()
+        except (FileNotFoundError, NotADirectoryError):
+            return False
+        except Exception as e:
+            logger.error("Error deleting template %s.%s: %s", template_name, extension, e)
+            return False
+        self.clear_cache()
+        return True
+
+_EXCEL_MULTI_SHEET_TEMPLATE: Dict[str, Any] = {
+    "name": "Multi-Sheet Dashboard",
+    "extension": "xlsx",
+    "description": "Excel template with data, summary, and dashboard sheets",
+    "version": "1.0",
+    "author": "Project Manager",
+    "sheets": {
+        "Data": {
+            "description": "Raw data input sheet",
+            "cells": {
+                "A1": {
+                    "value": "📊 {{titulo}}",
+                    "style": {
+                        "bold": True,
+                        "font_size": 16,
+                        "font_color": "1F4E79",
+                        "fill": {"pattern": "solid", "color": "E6F3FF"}
+                    }
+                },
+                "A2": {
+                    "value": "{{empresa}}",
+                    "style": {"italic": True, "font_size": 12}
                 },
-                "tables": {
-                    "DataTable": {
-                        "range": "B7:D9",
-                        "headers": True,
-                        "style": {
-                            "header_fill": "0070C0",
-                            "header_font_color": "FFFFFF",
-                            "border": "thin"
-                        }
+                "A3": {
+                    "value": "Fecha: {{fecha}} | Hora: {{hora}}",
+                    "style": {"font_size": 10, "font_color": "666666"}
+                },
+                "A5": {
+                    "value": "📋 DATOS PRINCIPALES",
+                    "style": {
+                        "bold": True,
+                        "font_size": 14,
+                        "fill": {"pattern": "solid", "color": "F2F2F2"}
                     }
-                }
+                },
+                "B7": {"value": "{{metrica1}}"},
+                "C7": {"value": "{{metrica2}}"},
+                "D7": {"value": "{{metrica3}}"},
+                "B8": {"value": "{{valor1}}", "style": {"bold": True}},
+                "C8": {"value": "{{valor2}}", "style": {"bold": True}},
+                "D8": {"value": "{{valor3}}", "style": {"bold": True}},
+                "B9": {"value": "{{estado1}}", "style": {"font_color": "28A745"}},
+                "C9": {"value": "{{estado2}}", "style": {"font_color": "28A745"}},
+                "D9": {"value": "{{estado3}}", "style": {"font_color": "28A745"}}
             },
-            "Summary": {
-                "description": "Summary and calculations sheet",
-                "cells": {
-                    "A1": {
-                        "value": "📈 RESUMEN EJECUTIVO",
-                        "style": {
-                            "bold": True,
-                            "font_size": 16,
-                            "font_color": "1F4E79",
-                            "fill": {"pattern": "solid", "color": "E6F3FF"}
-                        }
-                    },
-                    "A3": {
-                        "value": "Indicadores Clave",
-                        "style": {"bold": True, "font_size": 12}
-                    },
-                    "B4": {"value": "Total Items"},
-                    "C4": {"formula": "COUNTA(Data!B8:D8)"},
-                    "B5": {"value": "Promedio"},
-                    "C5": {"formula": "AVERAGE(Data!C8:D8)"},
-                    "B6": {"value": "Máximo"},
-                    "C6": {"formula": "MAX(Data!C8:D8)"},
-                    "B7": {"value": "Mínimo"},
-                    "C7": {"formula": "MIN(Data!C8:D8)"},
-                    "A9": {
-                        "value": "💡 ANÁLISIS",
-                        "style": {"bold": True, "font_size": 12}
-                    },
-                    "B10": {"value": "{{analisis}}"}
+            "tables": {
+                "DataTable": {
+                    "range": "B7:D9",
+                    "headers": True,
+                    "style": {
+                        "header_fill": "0070C0",
+                        "header_font_color": "FFFFFF",
+                        "border": "thin"
+                    }
                 }
+            }
+        },
+        "Summary": {
+            "description": "Summary and calculations sheet",
+            "cells": {
+                "A1": {
+                    "value": "📈 RESUMEN EJECUTIVO",
+                    "style": {
+                        "bold": True,
+                        "font_size": 16,
+                        "font_color": "1F4E79",
+                        "fill": {"pattern": "solid", "color": "E6F3FF"}
+                    }
+                },
+                "A3": {
+                    "value": "Indicadores Clave",
+                    "style": {"bold": True, "font_size": 12}
+                },
+                "B4": {"value": "Total Items"},
+                "C4": {"formula": "COUNTA(Data!B8:D8)"},
+                "B5": {"value": "Promedio"},
+                "C5": {"formula": "AVERAGE(Data!C8:D8)"},
+                "B6": {"value": "Máximo"},
+                "C6": {"formula": "MAX(Data!C8:D8)"},
+                "B7": {"value": "Mínimo"},
+                "C7": {"formula": "MIN(Data!C8:D8)"},
+                "A9": {
+                    "value": "💡 ANÁLISIS",
+                    "style": {"bold": True, "font_size": 12}
+                },
+                "B10": {"value": "{{analisis}}"}
+            }
+        },
+        "Dashboard": {
+            "description": "Visual dashboard with KPIs and insights",
+            "cells": {
+                "A1": {
+                    "value": "🎯 DASHBOARD EJECUTIVO",
+                    "style": {
+                        "bold": True,
+                        "font_size": 18,
+                        "font_color": "1F4E79",
+                        "fill": {"pattern": "solid", "color": "E6F3FF"}
+                    }
+                },
+                "A3": {
+                    "value": "KPIs Principales",
+                    "style": {"bold": True, "font_size": 14}
+                },
+                "B5": {
+                    "value": "Estado General",
+                    "style": {"bold": True}
+                },
+                "C5": {
+                    "value": "{{estado_general}}",
+                    "style": {
+                        "bold": True,
+                        "font_size": 14,
+                        "font_color": "28A745"
+                    }
+                },
+                "B6": {
+                    "value": "Tendencia",
+                    "style": {"bold": True}
+                },
+                "C6": {
+                    "value": "{{tendencia}}",
+                    "style": {"font_color": "0070C0"}
+                },
+                "A8": {
+                    "value": "📊 GRÁFICOS Y VISUALIZACIONES",
+                    "style": {"bold": True, "font_size": 12}
+                },
+                "B10": {"value": "Gráfico de barras: Métricas vs Valores"},
+                "B11": {"value": "Gráfico circular: Distribución por estados"},
+                "B12": {"value": "Gráfico de líneas: Tendencia temporal"},
+                "A14": {
+                    "value": "🔍 CONCLUSIONES",
+                    "style": {"bold": True, "font_size": 12}
+                },
+                "B15": {"value": "{{conclusiones}}"}
             },
-            "Dashboard": {
-                "description": "Visual dashboard with KPIs and insights",
-                "cells": {
-                    "A1": {
-                        "value": "🎯 DASHBOARD EJECUTIVO",
-                        "style": {
-                            "bold": True,
-                            "font_size": 18,
-                            "font_color": "1F4E79",
-                            "fill": {"pattern": "solid", "color": "E6F3FF"}
-                        }
-                    },
-                    "A3": {
-                        "value": "KPIs Principales",
-                        "style": {"bold": True, "font_size": 14}
-                    },
-                    "B5": {
-                        "value": "Estado General",
-                        "style": {"bold": True}
-                    },
-                    "C5": {
-                        "value": "{{estado_general}}",
-                        "style": {
-                            "bold": True,
-                            "font_size": 14,
-                            "font_color": "28A745"
-                        }
-                    },
-                    "B6": {
-                        "value": "Tendencia",
-                        "style": {"bold": True}
-                    },
-                    "C6": {
-                        "value": "{{tendencia}}",
-                        "style": {"font_color": "0070C0"}
-                    },
-                    "A8": {
-                        "value": "📊 GRÁFICOS Y VISUALIZACIONES",
-                        "style": {"bold": True, "font_size": 12}
-                    },
-                    "B10": {"value": "Gráfico de barras: Métricas vs Valores"},
-                    "B11": {"value": "Gráfico circular: Distribución por estados"},
-                    "B12": {"value": "Gráfico de líneas: Tendencia temporal"},
-                    "A14": {
-                        "value": "🔍 CONCLUSIONES",
-                        "style": {"bold": True, "font_size": 12}
-                    },
-                    "B15": {"value": "{{conclusiones}}"}
+            "charts": {
+                "MetricsChart": {
+                    "type": "bar",
+                    "title": "Métricas Principales",
+                    "data_range": "Data!B7:D8",
+                    "position": "B10:D15",
+                    "style": {
+                        "chart_type": "clustered_bar",
+                        "legend": True,
+                        "data_labels": True
+                    }
                 },
-                "charts": {
-                    "MetricsChart": {
-                        "type": "bar",
-                        "title": "Métricas Principales",
-                        "data_range": "Data!B7:D8",
-                        "position": "B10:D15",
-                        "style": {
-                            "chart_type": "clustered_bar",
-                            "legend": True,
-                            "data_labels": True
-                        }
-                    },
-                    "StatusChart": {
-                        "type": "pie",
-                        "title": "Distribución por Estados",
-                        "data_range": "Data!B9:D9",
-                        "position": "B16:D20",
-                        "style": {
-                            "legend": True,
-                            "data_labels": True,
-                            "colors": ["28A745", "FFC107", "DC3545"]
-                        }
+                "StatusChart": {
+                    "type": "pie",
+                    "title": "Distribución por Estados",
+                    "data_range": "Data!B9:D9",
+                    "position": "B16:D20",
+                    "style": {
+                        "legend": True,
+                        "data_labels": True,
+                        "colors": ["28A745", "FFC107", "DC3545"]
                     }
                 }
             }
+        }
+    },
+    "global_styles": {
+        "header_style": {
+            "bold": True,
+            "font_size": 12,
+            "fill": {"pattern": "solid", "color": "F2F2F2"}
         },
-        "global_styles": {
-            "header_style": {
-                "bold": True,
-                "font_size": 12,
-                "fill": {"pattern": "solid", "color": "F2F2F2"}
-            },
-            "data_style": {
-                "border": "thin",
-                "alignment": "center"
-            }
+        "data_style": {
+            "border": "thin",
+            "alignment": "center"
         }
     }
+}
 
-def create_html_template() -> Dict[str, Any]:
-    """Create an HTML template example."""
-    return {
-        "name": "Professional Report",
-        "extension": "html",
-        "description": "Professional HTML report with responsive design",
-        "css_framework": "bootstrap",
-        "content": """<!DOCTYPE html>
+def create_excel_multi_sheet_template() -> Dict[str, Any]:
+    """Create a multi-sheet Excel template example."""
+    return copy.deepcopy(_EXCEL_MULTI_SHEET_TEMPLATE)
+
+_HTML_TEMPLATE: Dict[str, Any] = {
+    "name": "Professional Report",
+    "extension": "html",
+    "description": "Professional HTML report with responsive design",
+    "css_framework": "bootstrap",
+    "content": """<!DOCTYPE html>
 <html lang="es">
 <head>
     <meta charset="UTF-8">
@@ -379,15 +442,17 @@ def create_html_template() -> Dict[str, Any]:
     <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
 </body>
 </html>"""
-    }
+}
 
-def create_docx_template() -> Dict[str, Any]:
-    """Create a DOCX template example."""
-    return {
-        "name": "Business Document",
-        "extension": "docx",
-        "description": "Professional Word document template",
-        "content": """{{titulo}}
+def create_html_template() -> Dict[str, Any]:
+    """Create an HTML template example."""
+    return copy.deepcopy(_HTML_TEMPLATE)
+
+_DOCX_TEMPLATE: Dict[str, Any] = {
+    "name": "Business Document",
+    "extension": "docx",
+    "description": "Professional Word document template",
+    "content": """{{titulo}}
 
 {{empresa}}
 Fecha: {{fecha}} | Hora: {{hora}}
@@ -425,21 +490,23 @@ CONCLUSIONES
 ---
 Generado automáticamente por Project Manager
 {{empresa}} | {{fecha}} | {{hora}}""",
-        "styles": {
-            "title": {"bold": True, "font_size": 18},
-            "heading1": {"bold": True, "font_size": 16},
-            "heading2": {"bold": True, "font_size": 14},
-            "normal": {"font_size": 12}
-        }
+    "styles": {
+        "title": {"bold": True, "font_size": 18},
+        "heading1": {"bold": True, "font_size": 16},
+        "heading2": {"bold": True, "font_size": 14},
+        "normal": {"font_size": 12}
     }
+}
 
-def create_markdown_template() -> Dict[str, Any]:
-    """Create a Markdown template example."""
-    return {
-        "name": "Technical Documentation",
-        "extension": "md",
-        "description": "Technical markdown documentation template",
-        "content": """# {{titulo}}
+def create_docx_template() -> Dict[str, Any]:
+    """Create a DOCX template example."""
+    return copy.deepcopy(_DOCX_TEMPLATE)
+
+_MARKDOWN_TEMPLATE: Dict[str, Any] = {
+    "name": "Technical Documentation",
+    "extension": "md",
+    "description": "Technical markdown documentation template",
+    "content": """# {{titulo}}
 
 **{{empresa}}**
 
@@ -488,118 +555,141 @@ def create_markdown_template() -> Dict[str, Any]:
 *Este documento fue generado automáticamente por Project Manager*
 
 *{{empresa}} | {{fecha}} | {{hora}}*"""
-    }
+}
+
+def create_markdown_template() -> Dict[str, Any]:
+    """Create a Markdown template example."""
+    return copy.deepcopy(_MARKDOWN_TEMPLATE)
 
 def initialize_external_templates() -> None:
     """Initialize external templates with examples."""
     loader = ExternalTemplateLoader()
 
+    # save_template only reads the dicts, so the constants need no copy
     templates = [
-        create_excel_multi_sheet_template(),
-        create_html_template(),
-        create_docx_template(),
-        create_markdown_template()
+        _EXCEL_MULTI_SHEET_TEMPLATE,
+        _HTML_TEMPLATE,
+        _DOCX_TEMPLATE,
+        _MARKDOWN_TEMPLATE
     ]
 
-    for template in templates:
+    # Each save writes its own file; the writes overlap while threads wait on I/O
+    with ThreadPoolExecutor(max_workers=len(templates)) as executor:
+        results = list(executor.map(lambda template: loader.save_template(template, template['extension']), templates))
+
+    for template, success in zip(templates, results):
         extension = template['extension']
-        success = loader.save_template(template, extension)
         if success:
-            print(f"External template '{template['name']}' ({extension}) initialized.")
+            logger.info("External template '%s' (%s) initialized.", template['name'], extension)
         else:
-            print(f"Failed to initialize template '{template['name']}' ({extension}).")
+            logger.error("Failed to initialize template '%s' (%s).", template['name'], extension)
+
+_BASE_PARAMS: Dict[str, str] = {
+    # Basic info
+    "titulo": "Documento Generado",
+    "empresa": "Empresa Ejemplo",
+    "fecha": "",  # fecha/hora are filled in on each call
+    "hora": "",
+
+    # Content sections
+    "introduccion": "Este documento fue generado automáticamente desde una plantilla externa.",
+    "objetivo": "Proporcionar información estructurada y profesional.",
+    "analisis": "El análisis muestra resultados positivos en las métricas principales.",
+    "conclusiones": "Las operaciones se desarrollan según lo planificado.",
+
+    # Metrics
+    "metrica1": "Productividad",
+    "valor1": "85%",
+    "estado1": "Activo",
+    "metrica2": "Calidad",
+    "valor2": "92%",
+    "estado2": "Excelente",
+    "metrica3": "Eficiencia",
+    "valor3": "78%",
+    "estado3": "Mejorable",
+
+    # Status classes for HTML
+    "estado1_class": "active",
+    "estado2_class": "completed",
+    "estado3_class": "pending",
+
+    # Additional fields
+    "version": "1.0",
+    "autor": "Sistema Automático",
+    "estado_general": "Operativo",
+    "tendencia": "Estable",
+
+    # Analysis fields
+    "analisis1": "Muestra resultados positivos",
+    "proyeccion2": "Se espera crecimiento del 15%",
+    "recomendacion3": "Implementar mejoras de eficiencia",
+    "tendencia1": "↗️ Ascendente",
+    "tendencia2": "➡️ Estable",
+    "tendencia3": "↘️ Descendente",
+
+    # Calculations
+    "total_general": "150",
+    "promedio_general": "85.5",
+    "maximo_general": "95"
+}
+
+# Overlays for file names containing a keyword; the first match wins
+_DASHBOARD_PARAMS: Dict[str, str] = {
+    "titulo": "Dashboard Principal",
+    "introduccion": "Panel de control principal con métricas clave del negocio.",
+    "objetivo": "Proporcionar una visión general del estado actual de las operaciones.",
+    "analisis": "El dashboard muestra indicadores positivos en productividad y calidad, con oportunidades de mejora en eficiencia.",
+    "conclusiones": "El estado general del negocio es positivo con tendencias estables."
+}
+
+_FINANCIAL_PARAMS: Dict[str, str] = {
+    "titulo": "Calculadora Financiera",
+    "metrica1": "Ingresos",
+    "valor1": "$10,000",
+    "metrica2": "Gastos",
+    "valor2": "$7,500",
+    "metrica3": "Utilidad",
+    "valor3": "$2,500",
+    "introduccion": "Análisis financiero y proyecciones económicas del proyecto.",
+    "objetivo": "Calcular y analizar los indicadores financieros clave.",
+    "analisis": "Los ingresos superan los gastos con una utilidad neta positiva.",
+    "conclusiones": "La situación financiera es saludable con margen de beneficio adecuado."
+}
+
+_CUSTOMER_PARAMS: Dict[str, str] = {
+    "titulo": "Base de Datos de Clientes",
+    "metrica1": "Clientes Activos",
+    "valor1": "150",
+    "metrica2": "Nuevos Clientes",
+    "valor2": "25",
+    "metrica3": "Satisfacción",
+    "valor3": "4.2/5",
+    "introduccion": "Base de datos actualizada con información de clientes.",
+    "objetivo": "Mantener información actualizada de la cartera de clientes.",
+    "analisis": "Crecimiento positivo en la base de clientes con alta satisfacción.",
+    "conclusiones": "La estrategia de captación de clientes está funcionando correctamente."
+}
+
+# Checked in priority order; the first variant whose keywords appear in
+# the file name wins
+_PARAM_VARIANTS = (
+    (re.compile(r'dashboard|principal'), _DASHBOARD_PARAMS),
+    (re.compile(r'financiera|calculator'), _FINANCIAL_PARAMS),
+    (re.compile(r'cliente|customer'), _CUSTOMER_PARAMS),
+)
 
 def get_external_template_params(file_name: str) -> Dict[str, str]:
     """Get default parameters for external templates."""
-    from datetime import datetime
-
-    base_params = {
-        # Basic info
-        "titulo": "Documento Generado",
-        "empresa": "Empresa Ejemplo",
-        "fecha": datetime.now().strftime("%Y-%m-%d"),
-        "hora": datetime.now().strftime("%H:%M:%S"),
-
-        # Content sections
-        "introduccion": "Este documento fue generado automáticamente desde una plantilla externa.",
-        "objetivo": "Proporcionar información estructurada y profesional.",
-        "analisis": "El análisis muestra resultados positivos en las métricas principales.",
-        "conclusiones": "Las operaciones se desarrollan según lo planificado.",
-
-        # Metrics
-        "metrica1": "Productividad",
-        "valor1": "85%",
-        "estado1": "Activo",
-        "metrica2": "Calidad",
-        "valor2": "92%",
-        "estado2": "Excelente",
-        "metrica3": "Eficiencia",
-        "valor3": "78%",
-        "estado3": "Mejorable",
-
-        # Status classes for HTML
-        "estado1_class": "active",
-        "estado2_class": "completed",
-        "estado3_class": "pending",
-
-        # Additional fields
-        "version": "1.0",
-        "autor": "Sistema Automático",
-        "estado_general": "Operativo",
-        "tendencia": "Estable",
-
-        # Analysis fields
-        "analisis1": "Muestra resultados positivos",
-        "proyeccion2": "Se espera crecimiento del 15%",
-        "recomendacion3": "Implementar mejoras de eficiencia",
-        "tendencia1": "↗️ Ascendente",
-        "tendencia2": "➡️ Estable",
-        "tendencia3": "↘️ Descendente",
-
-        # Calculations
-        "total_general": "150",
-        "promedio_general": "85.5",
-        "maximo_general": "95"
-    }
+    base_params = dict(_BASE_PARAMS)
+    # 'YYYY-MM-DDTHH:MM:SS' split in two: one clock read, no strftime parsing
+    base_params["fecha"], base_params["hora"] = datetime.now().isoformat(timespec="seconds").split("T")
 
     # Customize based on file name
     file_lower = file_name.lower()
 
-    if "dashboard" in file_lower or "principal" in file_lower:
-        base_params.update({
-            "titulo": "Dashboard Principal",
-            "introduccion": "Panel de control principal con métricas clave del negocio.",
-            "objetivo": "Proporcionar una visión general del estado actual de las operaciones.",
-            "analisis": "El dashboard muestra indicadores positivos en productividad y calidad, con oportunidades de mejora en eficiencia.",
-            "conclusiones": "El estado general del negocio es positivo con tendencias estables."
-        })
-    elif "financiera" in file_lower or "calculator" in file_lower:
-        base_params.update({
-            "titulo": "Calculadora Financiera",
-            "metrica1": "Ingresos",
-            "valor1": "$10,000",
-            "metrica2": "Gastos",
-            "valor2": "$7,500",
-            "metrica3": "Utilidad",
-            "valor3": "$2,500",
-            "introduccion": "Análisis financiero y proyecciones económicas del proyecto.",
-            "objetivo": "Calcular y analizar los indicadores financieros clave.",
-            "analisis": "Los ingresos superan los gastos con una utilidad neta positiva.",
-            "conclusiones": "La situación financiera es saludable con margen de beneficio adecuado."
-        })
-    elif "cliente" in file_lower or "customer" in file_lower:
-        base_params.update({
-            "titulo": "Base de Datos de Clientes",
-            "metrica1": "Clientes Activos",
-            "valor1": "150",
-            "metrica2": "Nuevos Clientes",
-            "valor2": "25",
-            "metrica3": "Satisfacción",
-            "valor3": "4.2/5",
-            "introduccion": "Base de datos actualizada con información de clientes.",
-            "objetivo": "Mantener información actualizada de la cartera de clientes.",
-            "analisis": "Crecimiento positivo en la base de clientes con alta satisfacción.",
-            "conclusiones": "La estrategia de captación de clientes está funcionando correctamente."
-        })
+    for keywords, overlay in _PARAM_VARIANTS:
+        if keywords.search(file_lower):
+            base_params.update(overlay)
+            break
 
     return base_params
\ No newline at end of file
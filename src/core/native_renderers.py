@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from pathlib import Path
 
@@ -368,16 +369,22 @@ class WordNativeRenderer:
             return RGBColor(0, 0, 0)  # Default to black
 
 
+@lru_cache(maxsize=128)
+def _compile_jinja2(template_content: str) -> 'Template':
+    """Compile Jinja2 source once; repeated renders reuse the Template."""
+    # Imported only on a cache miss; a failed import is not cached
+    try:
+        from jinja2 import Template
+    except ImportError:
+        raise ImportError("jinja2 is required for Jinja2 template rendering. Install with: pip install jinja2")
+    return Template(template_content)
+
+
 class Jinja2Renderer:
     """Renders templates using Jinja2 template engine."""
 
     def render(self, template_data: Dict, params: Dict) -> str:
         """Render Jinja2 template with parameters."""
-        try:
-            from jinja2 import Template
-        except ImportError:
-            raise ImportError("jinja2 is required for Jinja2 template rendering. Install with: pip install jinja2")
-
         template_content = template_data.get('content', '')
-        template = Template(template_content)
+        template = _compile_jinja2(template_content)
         return template.render(**params)
\ No newline at end of file
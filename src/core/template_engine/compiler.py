@@ -0,0 +1,462 @@
+"""
+Template Compiler - Compila plantillas a un programa de opcodes.
+
+El texto del template se tokeniza una sola vez y se convierte en un árbol
+de opcodes (LITERAL, VAR, FUNC_CALL, IF, FOR, SWITCH) que el renderer
+interpreta. El resultado se cachea por texto, así renderizar la misma
+plantilla varias veces no vuelve a parsearla.
+
+Las variables, argumentos y condiciones se compilan a funciones que leen el
+contexto, y los nombres de funciones (DATE.now, FORMAT.currency, ...) se
+resuelven a su método una sola vez, al compilar. Las llamadas puras del
+cuerpo de un for que no dependen de la variable del loop se marcan para
+evaluarse una sola vez por loop, y los for sobre rangos literales pequeños
+se desenrollan.
+
+Finalmente el programa se traduce a una función Python (compile + exec),
+que es lo que ejecuta el renderer.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from .evaluator import compile_expression, compile_value, parse_literal
+from .functions import TemplateFunctions
+
+# Opcodes
+OP_LITERAL = 'literal'
+OP_VAR = 'var'
+OP_FUNC_CALL = 'func_call'
+OP_IF = 'if'
+OP_FOR = 'for'
+OP_SWITCH = 'switch'
+
+# Bloques con apertura {{#tipo ...}} y cierre {{/tipo}}
+BLOCK_TYPES = ('if', 'for', 'switch')
+
+# Un {{}} vacío no es un tag y queda como texto literal
+TAG_PATTERN = re.compile(r'\{\{([^}]+)\}\}')
+FUNCTION_PATTERN = re.compile(r'([^(]+)\((.*)\)')
+LOOP_VARS_PATTERN = re.compile(r'(\w+(?:\s*,\s*\w+)?)\s+in\s+')
+LITERAL_RANGE_PATTERN = re.compile(r'\s*(\w+)\s+in\s+(\d+)\.\.(\d+)\s*$')
+
+# Los for sobre rangos literales de hasta este tamaño se desenrollan
+UNROLL_MAX = 8
+
+
+class Op(NamedTuple):
+    """Instrucción del programa compilado."""
+    code: str
+    payload: Any
+
+
+class Program(tuple):
+    """Programa compilado: tupla de Op más la función Python generada (run)."""
+    run: Callable[..., None]
+
+
+class _Block:
+    """Bloque abierto durante la compilación."""
+
+    def __init__(self, kind: str, header: str, line: int):
+        self.kind = kind
+        self.header = header
+        self.line = line
+        # if: [(condición | None, ops)]; switch: [(valor | None, ops)]
+        self.branches: List[Tuple[Optional[str], List[Op]]] = []
+        self.body: List[Op] = []
+
+    def open_branch(self, header: Optional[str]) -> None:
+        self.body = []
+        self.branches.append((header, self.body))
+
+
+def _line_at(text: str, pos: int) -> int:
+    return text.count('\n', 0, pos) + 1
+
+
+def _compile_expression_tag(content: str) -> Op:
+    """Compilar {{variable}} o {{FUNCION(args)}}."""
+    if '(' in content:
+        func_match = FUNCTION_PATTERN.match(content)
+        if func_match:
+            func_name = func_match.group(1).strip()
+            args_str = func_match.group(2).strip()
+            arg_srcs = [arg.strip() for arg in args_str.split(',')] if args_str else []
+            args = tuple(compile_value(arg) for arg in arg_srcs)
+            # Nombres del contexto que leen los argumentos (los literales no cuentan)
+            names = frozenset(arg for arg in arg_srcs if not parse_literal(arg)[0])
+            method = TemplateFunctions.resolve(func_name)
+            # payload: (método sin instancia | None, argumentos compilados, nombre,
+            #           nombres leídos, es pura)
+            return Op(OP_FUNC_CALL, (method, args, func_name, names, TemplateFunctions.is_pure(method)))
+
+    # Los literales ({{'texto'}}, {{42}}) se emiten como texto
+    is_literal, literal = parse_literal(content)
+    if is_literal:
+        return Op(OP_LITERAL, str(literal))
+    # payload: (función del contexto, nombre)
+    return Op(OP_VAR, (compile_value(content), content))
+
+
+def _close_block(block: _Block) -> Op:
+    """Convertir un bloque cerrado en su opcode."""
+    if block.kind == 'if':
+        # Condiciones compiladas a predicados; None representa el else
+        branches = tuple(
+            (compile_expression(cond) if cond is not None else None, tuple(ops))
+            for cond, ops in block.branches
+        )
+        return Op(OP_IF, branches)
+    if block.kind == 'for':
+        return Op(OP_FOR, (block.header, tuple(block.branches[0][1]), ()))
+    # switch: la primera rama contiene el texto previo al primer case y se descarta
+    cases = []
+    default = None
+    literal_values = []
+    for value, ops in block.branches[1:]:
+        if value is None:
+            default = tuple(ops)
+        else:
+            cases.append((compile_value(value), tuple(ops)))
+            literal_values.append(parse_literal(value))
+    return Op(OP_SWITCH, (compile_value(block.header), tuple(cases), default, _case_table(literal_values)))
+
+
+def _case_table(literal_values: List[Tuple[bool, Any]]) -> Optional[Dict[Any, int]]:
+    """
+    Construir la tabla valor -> índice de case de un switch.
+
+    Solo es posible si todos los case son literales; ante valores repetidos
+    gana el primero, igual que la búsqueda lineal.
+    """
+    if not all(is_literal for is_literal, _ in literal_values):
+        return None
+    table: Dict[Any, int] = {}
+    for index, (_, value) in enumerate(literal_values):
+        table.setdefault(value, index)
+    return table
+
+
+def _find_invariants(loop_expr: str, body: Tuple[Op, ...]) -> Tuple[int, ...]:
+    """
+    Buscar llamadas del cuerpo de un for que no dependen de la iteración.
+
+    Una llamada es invariante si la función es pura y ninguno de sus
+    argumentos lee una variable del loop; el renderer la evalúa una sola
+    vez antes de iterar.
+
+    Returns:
+        Índices en body de las llamadas invariantes
+    """
+    match = LOOP_VARS_PATTERN.match(loop_expr)
+    if not match:
+        return ()
+    loop_vars = {name.strip() for name in match.group(1).split(',')}
+    return tuple(
+        index for index, op in enumerate(body)
+        if op.code == OP_FUNC_CALL
+        and op.payload[4]
+        and not op.payload[3] & loop_vars
+    )
+
+
+def _unroll_range(loop_expr: str, body: Tuple[Op, ...]) -> Optional[List[Op]]:
+    """
+    Desenrollar un for sobre un rango literal pequeño (ej: "i in 1..5").
+
+    Cada {{i}} del cuerpo se sustituye por su valor. Solo se desenrolla si
+    el cuerpo no lee la variable del loop de otra forma (condiciones,
+    argumentos, bloques anidados).
+
+    Returns:
+        Cuerpo repetido por iteración, o None si no se puede desenrollar
+    """
+    match = LITERAL_RANGE_PATTERN.match(loop_expr)
+    if not match:
+        return None
+    var_name = match.group(1)
+    start, end = int(match.group(2)), int(match.group(3))
+    if end - start + 1 > UNROLL_MAX:
+        return None
+    for op in body:
+        if op.code == OP_FUNC_CALL:
+            if var_name in op.payload[3]:
+                return None
+        elif op.code not in (OP_LITERAL, OP_VAR):
+            return None
+    unrolled: List[Op] = []
+    for value in range(start, end + 1):
+        for op in body:
+            if op.code == OP_VAR and op.payload[1] == var_name:
+                op = Op(OP_LITERAL, str(value))
+            unrolled.append(op)
+    return unrolled
+
+
+def _append_merged(merged: List[Op], op: Op) -> None:
+    """Agregar un opcode fusionándolo con el LITERAL anterior si corresponde."""
+    if op.code == OP_LITERAL:
+        if not op.payload:
+            return
+        if merged and merged[-1].code == OP_LITERAL:
+            merged[-1] = Op(OP_LITERAL, merged[-1].payload + op.payload)
+            return
+    merged.append(op)
+
+
+def _merge_literals(ops: List[Op]) -> Tuple[Op, ...]:
+    """Fusionar LITERAL consecutivos, también dentro de if/for/switch."""
+    merged: List[Op] = []
+    for op in ops:
+        if op.code == OP_IF:
+            op = Op(OP_IF, tuple((cond, _merge_literals(body)) for cond, body in op.payload))
+        elif op.code == OP_FOR:
+            loop_expr, body, _ = op.payload
+            body = _merge_literals(body)
+            unrolled = _unroll_range(loop_expr, body)
+            if unrolled is not None:
+                for unrolled_op in unrolled:
+                    _append_merged(merged, unrolled_op)
+                continue
+            op = Op(OP_FOR, (loop_expr, body, _find_invariants(loop_expr, body)))
+        elif op.code == OP_SWITCH:
+            scrutinee, cases, default, table = op.payload
+            cases = tuple((value, _merge_literals(body)) for value, body in cases)
+            if default is not None:
+                default = _merge_literals(default)
+            op = Op(OP_SWITCH, (scrutinee, cases, default, table))
+        _append_merged(merged, op)
+    return tuple(merged)
+
+
+class _CodeGen:
+    """
+    Traducir un programa de opcodes a código Python.
+
+    Genera una función _render(renderer, context, out) equivalente a
+    interpretar los opcodes, sin el despacho por opcode. Los valores que
+    no son literales de Python (funciones compiladas, tablas de case) se
+    pasan como constantes del namespace (_k0, _k1, ...).
+    """
+
+    def __init__(self):
+        self.lines: List[str] = []
+        self.constants: Dict[str, Any] = {}
+        self.counter = 0
+
+    def const(self, value: Any) -> str:
+        name = f'_k{len(self.constants)}'
+        self.constants[name] = value
+        return name
+
+    def local(self, prefix: str) -> str:
+        self.counter += 1
+        return f'{prefix}{self.counter}'
+
+    def emit(self, indent: int, line: str) -> None:
+        self.lines.append('    ' * indent + line)
+
+    def block(self, ops: Tuple[Op, ...], indent: int, inlined: Optional[Dict[int, str]] = None) -> None:
+        start = len(self.lines)
+        for index, op in enumerate(ops):
+            if inlined and index in inlined:
+                self.emit(indent, f'append({inlined[index]})')
+                continue
+            getattr(self, f'_gen_{op.code}')(op.payload, indent)
+        if len(self.lines) == start:
+            self.emit(indent, 'pass')
+
+    def _gen_literal(self, text: str, indent: int) -> None:
+        self.emit(indent, f'append({text!r})')
+
+    def _gen_var(self, payload: tuple, indent: int) -> None:
+        value = self.local('v')
+        self.emit(indent, f'{value} = {self.const(payload[0])}(context)')
+        self.emit(indent, f'append({value} if type({value}) is str else str({value}))')
+
+    def _gen_func_call(self, payload: tuple, indent: int) -> None:
+        fn, arg_getters, _, _, pure = payload
+        if fn is None or pure:
+            # Funciones puras (memoizadas) y desconocidas (error) pasan por el renderer
+            self.emit(indent, f'append(renderer._call({self.const(payload)}))')
+            return
+        args = ''.join(f', {self.const(arg)}(context)' for arg in arg_getters)
+        self.emit(indent, f'append(str({self.const(fn)}(functions{args})))')
+
+    def _gen_if(self, branches: tuple, indent: int) -> None:
+        for index, (predicate, ops) in enumerate(branches):
+            if predicate is None:
+                if index == 0:
+                    self.block(ops, indent)
+                else:
+                    self.emit(indent, 'else:')
+                    self.block(ops, indent + 1)
+                return
+            keyword = 'if' if index == 0 else 'elif'
+            self.emit(indent, f'{keyword} {self.const(predicate)}(context):')
+            self.block(ops, indent + 1)
+
+    def _gen_for(self, payload: tuple, indent: int) -> None:
+        loop_expr, ops, invariants = payload
+        variables, iterable = self.local('names'), self.local('iterable')
+        self.emit(indent, f'{variables}, {iterable} = evaluate_for_loop({loop_expr!r})')
+        match = LOOP_VARS_PATTERN.match(loop_expr)
+        if not match:
+            return
+        names = [name.strip() for name in match.group(1).split(',')]
+
+        # Llamadas invariantes: una evaluación antes de iterar
+        inlined: Dict[int, str] = {}
+        if invariants:
+            self.emit(indent, f'if {iterable}:')
+            for index in invariants:
+                inlined[index] = self.local('invariant')
+                self.emit(indent + 1, f'{inlined[index]} = renderer._call({self.const(ops[index].payload)})')
+
+        items = iterable
+        if len(names) == 2:
+            items = self.local('items')
+            self.emit(indent, f'{items} = {iterable}.items() if isinstance({iterable}, dict) else enumerate({iterable})')
+        loop_values = [self.local('value') for _ in names]
+        saved = [self.local('old') for _ in names]
+        self.emit(indent, f'for {", ".join(loop_values)} in {items}:')
+        for name, old in zip(names, saved):
+            self.emit(indent + 1, f'{old} = context.get({name!r})')
+        for name, value in zip(names, loop_values):
+            self.emit(indent + 1, f'context[{name!r}] = {value}')
+        self.block(ops, indent + 1, inlined)
+        # Restaurar contexto
+        for name, old in zip(names, saved):
+            self.emit(indent + 1, f'if {old} is not None:')
+            self.emit(indent + 2, f'context[{name!r}] = {old}')
+            self.emit(indent + 1, 'else:')
+            self.emit(indent + 2, f'context.pop({name!r}, None)')
+
+    def _gen_switch(self, payload: tuple, indent: int) -> None:
+        switch_getter, cases, default, table = payload
+        value = self.local('switch')
+        self.emit(indent, f'{value} = {self.const(switch_getter)}(context)')
+        if table is not None:
+            # Todos los case son literales: búsqueda directa por valor
+            index = self.local('case')
+            self.emit(indent, 'try:')
+            self.emit(indent + 1, f'{index} = {self.const(table)}.get({value})')
+            self.emit(indent, 'except TypeError:')
+            self.emit(indent + 1, f'{index} = None')
+            conditions = [f'{index} == {position}' for position in range(len(cases))]
+        else:
+            conditions = [f'{value} == {self.const(case_getter)}(context)' for case_getter, _ in cases]
+        for position, (condition, (_, ops)) in enumerate(zip(conditions, cases)):
+            self.emit(indent, f'{"if" if position == 0 else "elif"} {condition}:')
+            self.block(ops, indent + 1)
+        if default is not None:
+            if cases:
+                self.emit(indent, 'else:')
+                self.block(default, indent + 1)
+            else:
+                self.block(default, indent)
+
+
+def _generate(program: Tuple[Op, ...]) -> Callable[..., None]:
+    """Generar y compilar la función Python de un programa."""
+    gen = _CodeGen()
+    gen.emit(0, 'def _render(renderer, context, out):')
+    gen.emit(1, 'append = out.append')
+    gen.emit(1, 'functions = renderer.functions')
+    gen.emit(1, 'evaluate_for_loop = renderer.evaluator.evaluate_for_loop')
+    gen.block(program, 1)
+    namespace = dict(gen.constants)
+    exec(compile('\n'.join(gen.lines), '<template>', 'exec'), namespace)
+    return namespace['_render']
+
+
+@lru_cache(maxsize=256)
+def compile_template(template: str) -> Program:
+    """
+    Compilar un template a un programa.
+
+    Args:
+        template: String del template
+
+    Returns:
+        Programa compilado (tupla de Op con la función generada en run)
+
+    Raises:
+        SyntaxError: Si los bloques no están balanceados
+    """
+    root: List[Op] = []
+    out = root
+    stack: List[_Block] = []
+    errors: List[str] = []
+    position = 0
+
+    for match in TAG_PATTERN.finditer(template):
+        if match.start() > position:
+            out.append(Op(OP_LITERAL, template[position:match.start()]))
+        position = match.end()
+
+        raw = match.group(1)
+        content = raw.strip()
+        line = _line_at(template, match.start())
+
+        if raw.startswith('#'):
+            kind, _, header = content[1:].partition(' ')
+            header = header.strip()
+            if kind in BLOCK_TYPES:
+                block = _Block(kind, header, line)
+                block.open_branch(header)
+                stack.append(block)
+                out = block.body
+                continue
+            if kind in ('case', 'default') and stack and stack[-1].kind == 'switch':
+                stack[-1].open_branch(header if kind == 'case' else None)
+                out = stack[-1].body
+                continue
+            out.append(Op(OP_LITERAL, match.group(0)))
+
+        elif raw.startswith('/'):
+            kind = content[1:].strip()
+            if kind in ('case', 'default') and stack and stack[-1].kind == 'switch':
+                # El cierre de un case es opcional; el texto hasta el próximo case se ignora
+                stack[-1].body = []
+                out = stack[-1].body
+                continue
+            if kind not in BLOCK_TYPES:
+                out.append(Op(OP_LITERAL, match.group(0)))
+                continue
+            if not stack:
+                errors.append(f"Línea {line}: Bloque {{{{/{kind}}}}} sin apertura")
+                continue
+            block = stack.pop()
+            if block.kind != kind:
+                errors.append(
+                    f"Línea {line}: Esperaba {{{{/{block.kind}}}}} pero encontró {{{{/{kind}}}}}"
+                )
+            out = stack[-1].body if stack else root
+            out.append(_close_block(block))
+
+        elif content == 'else' and stack and stack[-1].kind == 'if':
+            stack[-1].open_branch(None)
+            out = stack[-1].body
+
+        elif content.startswith('elif ') and stack and stack[-1].kind == 'if':
+            stack[-1].open_branch(content[5:].strip())
+            out = stack[-1].body
+
+        else:
+            out.append(_compile_expression_tag(content))
+
+    if position < len(template):
+        out.append(Op(OP_LITERAL, template[position:]))
+
+    for block in stack:
+        errors.append(f"Línea {block.line}: Bloque {{{{#{block.kind}}}}} sin cerrar")
+
+    if errors:
+        raise SyntaxError(f"Template syntax errors: {'; '.join(errors)}")
+
+    program = Program(_merge_literals(root))
+    program.run = _generate(program)
+    return program
@@ -7,8 +7,107 @@ Evalúa expresiones como:
 - value1 && value2
 """
 
+import operator
 import re
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Tuple
+
+
+def parse_literal(value: str) -> Tuple[bool, Any]:
+    """
+    Interpretar un literal (string, booleano o número).
+
+    Returns:
+        Tupla (es_literal, valor)
+    """
+    value = value.strip()
+
+    # String literal
+    if (value.startswith("'") and value.endswith("'")) or \
+       (value.startswith('"') and value.endswith('"')):
+        return True, value[1:-1]
+
+    # Boolean
+    if value.lower() == 'true':
+        return True, True
+    if value.lower() == 'false':
+        return True, False
+
+    # Number
+    try:
+        if '.' in value:
+            return True, float(value)
+        return True, int(value)
+    except ValueError:
+        return False, None
+
+
+@lru_cache(maxsize=1024)
+def compile_value(value: str) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Compilar un valor a una función que lo resuelve contra un contexto.
+
+    Los literales se resuelven una sola vez; los nombres se buscan en el
+    contexto y, si no existen, se retornan como string.
+    """
+    value = value.strip()
+    is_literal, literal = parse_literal(value)
+    if is_literal:
+        return lambda context: literal
+    return lambda context: context.get(value, value)
+
+
+# Orden de búsqueda: los operadores de dos caracteres antes que '>' y '<'
+COMPARISON_OPERATORS = (
+    ('==', operator.eq),
+    ('!=', operator.ne),
+    ('>=', operator.ge),
+    ('<=', operator.le),
+    ('>', operator.gt),
+    ('<', operator.lt),
+)
+
+
+@lru_cache(maxsize=1024)
+def compile_expression(expression: str) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Compilar una expresión condicional a una función del contexto.
+
+    Soporta &&, ||, comparaciones (==, !=, >=, <=, >, <), negación (!)
+    y valores simples. La expresión se analiza una sola vez; evaluarla
+    después solo cuesta llamadas a funciones ya construidas.
+
+    Args:
+        expression: Expresión a compilar (ej: "inversion > 100000")
+
+    Returns:
+        Función que recibe el contexto y retorna el resultado
+    """
+    expression = expression.strip()
+
+    # Operadores lógicos
+    if '&&' in expression:
+        parts = tuple(compile_expression(part) for part in expression.split('&&'))
+        return lambda context: all(part(context) for part in parts)
+    if '||' in expression:
+        parts = tuple(compile_expression(part) for part in expression.split('||'))
+        return lambda context: any(part(context) for part in parts)
+
+    # Comparaciones
+    for symbol, compare in COMPARISON_OPERATORS:
+        if symbol in expression:
+            left_src, right_src = expression.split(symbol, 1)
+            left = compile_value(left_src)
+            right = compile_value(right_src)
+            return lambda context: compare(left(context), right(context))
+
+    # Negación
+    if expression.startswith('!'):
+        negated = compile_expression(expression[1:])
+        return lambda context: not negated(context)
+
+    # Variable o valor literal
+    return compile_value(expression)
 
 
 class ExpressionEvaluator:
@@ -33,88 +132,11 @@ class ExpressionEvaluator:
         Returns:
             Resultado de la expresión
         """
-        expression = expression.strip()
-
-        # Evaluar operadores lógicos
-        if '&&' in expression or '||' in expression:
-            return self._evaluate_logical(expression)
-
-        # Evaluar comparaciones
-        if any(op in expression for op in ['==', '!=', '>=', '<=', '>', '<']):
-            return self._evaluate_comparison(expression)
-
-        # Evaluar negación
-        if expression.startswith('!'):
-            return not self.evaluate(expression[1:])
-
-        # Evaluar variable o valor literal
-        return self._evaluate_value(expression)
-
-    def _evaluate_logical(self, expression: str) -> bool:
-        """Evaluar operador lógico (&&, ||)."""
-        if '&&' in expression:
-            parts = expression.split('&&')
-            return all(self.evaluate(part.strip()) for part in parts)
-        elif '||' in expression:
-            parts = expression.split('||')
-            return any(self.evaluate(part.strip()) for part in parts)
-        return False
-
-    def _evaluate_comparison(self, expression: str) -> bool:
-        """Evaluar comparación (==, !=, >, <, >=, <=)."""
-        operators = ['==', '!=', '>=', '<=', '>', '<']
-
-        for op in operators:
-            if op in expression:
-                parts = expression.split(op, 1)
-                if len(parts) == 2:
-                    left = self._evaluate_value(parts[0].strip())
-                    right = self._evaluate_value(parts[1].strip())
-
-                    if op == '==':
-                        return left == right
-                    elif op == '!=':
-                        return left != right
-                    elif op == '>':
-                        return left > right
-                    elif op == '<':
-                        return left < right
-                    elif op == '>=':
-                        return left >= right
-                    elif op == '<=':
-                        return left <= right
-
-        return False
+        return compile_expression(expression)(self.context)
 
     def _evaluate_value(self, value: str) -> Any:
         """Evaluar un valor (variable, string, número, booleano)."""
-        value = value.strip()
-
-        # String literal
-        if (value.startswith("'") and value.endswith("'")) or \
-           (value.startswith('"') and value.endswith('"')):
-            return value[1:-1]
-
-        # Boolean
-        if value.lower() == 'true':
-            return True
-        if value.lower() == 'false':
-            return False
-
-        # Number
-        try:
-            if '.' in value:
-                return float(value)
-            return int(value)
-        except ValueError:
-            pass
-
-        # Variable del contexto
-        if value in self.context:
-            return self.context[value]
-
-        # Si no se encuentra, retornar como string
-        return value
+        return compile_value(value)(self.context)
 
     def evaluate_for_loop(self, expression: str) -> tuple:
         """
@@ -123,6 +145,7 @@ class ExpressionEvaluator:
         Soporta:
         - item in array
         - i in 1..10
+        - i in 1..variable
         - key, value in object
 
         Args:
@@ -145,11 +168,11 @@ class ExpressionEvaluator:
         # Evaluar iterable
         # Range: 1..10
         if '..' in iterable_part:
-            range_match = re.match(r'(\d+)\.\.(\d+)', iterable_part)
+            range_match = re.match(r'(\w+)\.\.(\w+)', iterable_part)
             if range_match:
-                start = int(range_match.group(1))
-                end = int(range_match.group(2))
-                iterable = list(range(start, end + 1))
+                start = self._range_bound(range_match.group(1))
+                end = self._range_bound(range_match.group(2))
+                iterable = range(start, end + 1)
             else:
                 raise ValueError(f"Invalid range: {iterable_part}")
         # Variable del contexto
@@ -159,3 +182,14 @@ class ExpressionEvaluator:
             raise ValueError(f"Variable '{iterable_part}' not found in context")
 
         return variables, iterable
+
+    def _range_bound(self, bound: str) -> int:
+        """Resolver un límite de rango: número literal o variable del contexto."""
+        if bound.isdigit():
+            return int(bound)
+        if bound not in self.context:
+            raise ValueError(f"Variable '{bound}' not found in context")
+        try:
+            return int(self.context[bound])
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid range bound '{bound}': {self.context[bound]!r}")
@@ -5,16 +5,34 @@ Proporciona funciones como DATE, MATH, STRING, FORMAT, RANDOM, USER.
 """
 
 from datetime import datetime
-from typing import Any, List
+from functools import lru_cache
+from typing import Any, Callable, List, Optional
 import random
 import string
 import uuid
 import os
 
 
+@lru_cache(maxsize=128)
+def _to_strftime(pattern: str) -> str:
+    """Convertir un patrón de DATE.format (ej: 'DD/MM/YYYY') a formato strftime."""
+    py_pattern = pattern.replace('DD', '%d').replace('MM', '%m').replace('YYYY', '%Y')
+    return py_pattern.replace('HH', '%H').replace('mm', '%M').replace('ss', '%S')
+
+
 class TemplateFunctions:
     """Clase que proporciona todas las funciones disponibles en plantillas."""
 
+    # Funciones que solo dependen de sus argumentos. Se excluyen DATE.*
+    # (leen el reloj), USER.* (leen el entorno y el estado del usuario)
+    # y RANDOM.*.
+    PURE_FUNCTIONS = frozenset({
+        'math_round', 'math_sum', 'math_avg', 'math_percentage', 'math_min', 'math_max',
+        'string_upper', 'string_lower', 'string_capitalize', 'string_replace',
+        'string_trim', 'string_length',
+        'format_currency', 'format_number', 'format_phone', 'format_percent',
+    })
+
     def __init__(self, context: dict = None):
         """
         Inicializar funciones con contexto.
@@ -50,11 +68,8 @@ class TemplateFunctions:
         Args:
             pattern: Patrón de formato (ej: 'DD/MM/YYYY', 'YYYY-MM-DD')
         """
-        now = datetime.now()
-        # Convertir pattern a formato Python
-        py_pattern = pattern.replace('DD', '%d').replace('MM', '%m').replace('YYYY', '%Y')
-        py_pattern = py_pattern.replace('HH', '%H').replace('mm', '%M').replace('ss', '%S')
-        return now.strftime(py_pattern)
+        # Convertir pattern a formato Python (cacheado por patrón)
+        return datetime.now().strftime(_to_strftime(pattern))
 
     # ===== MATH Functions =====
 
@@ -160,6 +175,34 @@ class TemplateFunctions:
 
     # ===== Método principal para ejecutar funciones =====
 
+    @classmethod
+    def resolve(cls, function_name: str) -> Optional[Callable[..., Any]]:
+        """
+        Resolver el nombre de una función a su método (sin instancia).
+
+        Args:
+            function_name: Nombre de la función (ej: 'DATE.now', 'MATH.round')
+
+        Returns:
+            Función a invocar como fn(instancia, *args) o None si no existe
+        """
+        # Convertir 'DATE.now' a 'date_now'
+        method = getattr(cls, function_name.lower().replace('.', '_'), None)
+        return method if callable(method) else None
+
+    @classmethod
+    def is_pure(cls, method: Optional[Callable[..., Any]]) -> bool:
+        """
+        Indicar si un método resuelto es puro (ver PURE_FUNCTIONS).
+
+        Args:
+            method: Método retornado por resolve()
+
+        Returns:
+            True si su resultado solo depende de los argumentos
+        """
+        return method is not None and method.__name__ in cls.PURE_FUNCTIONS
+
     def execute(self, function_name: str, *args) -> Any:
         """
         Ejecutar una función por nombre.
@@ -171,13 +214,9 @@ class TemplateFunctions:
         Returns:
             Resultado de la función
         """
-        # Convertir 'DATE.now' a 'date_now'
-        method_name = function_name.lower().replace('.', '_')
-
-        # Buscar el método
-        method = getattr(self, method_name, None)
-        if method and callable(method):
-            return method(*args)
+        method = self.resolve(function_name)
+        if method is not None:
+            return method(self, *args)
 
         raise ValueError(f"Function '{function_name}' not found")
 
@@ -187,5 +226,5 @@ class TemplateFunctions:
             name.replace('_', '.').upper()
             for name in dir(self)
             if not name.startswith('_') and callable(getattr(self, name))
-            and name not in ['execute', 'get_available_functions']
+            and name not in ['execute', 'resolve', 'is_pure', 'get_available_functions']
         ]
@@ -32,6 +32,16 @@ class TemplateParser:
     ELSE_PATTERN = r'\{\{else\}\}'  # {{else}}
     ELIF_PATTERN = r'\{\{elif\s+([^}]*)\}\}'  # {{elif condition}}
 
+    # Todas las expresiones en una sola regex; el orden de las alternativas
+    # define la prioridad cuando dos patrones empiezan en la misma posición
+    TOKEN_REGEX = re.compile(
+        f'(?P<variable>{VARIABLE_PATTERN})'
+        f'|(?P<block_start>{BLOCK_START_PATTERN})'
+        f'|(?P<block_end>{BLOCK_END_PATTERN})'
+        f'|(?P<else>{ELSE_PATTERN})'
+        f'|(?P<elif>{ELIF_PATTERN})'
+    )
+
     def __init__(self):
         """Inicializar parser."""
         pass
@@ -40,6 +50,8 @@ class TemplateParser:
         """
         Parsear template en tokens.
 
+        Recorre el template una sola vez con TOKEN_REGEX.
+
         Args:
             template: String del template a parsear
 
@@ -51,48 +63,25 @@ class TemplateParser:
         line = 1
         col = 1
 
-        while position < len(template):
-            # Buscar próxima expresión
-            match_var = re.search(self.VARIABLE_PATTERN, template[position:])
-            match_block_start = re.search(self.BLOCK_START_PATTERN, template[position:])
-            match_block_end = re.search(self.BLOCK_END_PATTERN, template[position:])
-            match_else = re.search(self.ELSE_PATTERN, template[position:])
-            match_elif = re.search(self.ELIF_PATTERN, template[position:])
-
-            # Encontrar el match más cercano
-            matches = [
-                (match_var, 'variable') if match_var else None,
-                (match_block_start, 'block_start') if match_block_start else None,
-                (match_block_end, 'block_end') if match_block_end else None,
-                (match_else, 'else') if match_else else None,
-                (match_elif, 'elif') if match_elif else None,
-            ]
-            matches = [m for m in matches if m is not None]
-
-            if not matches:
-                # No hay más expresiones, agregar texto restante
-                if position < len(template):
-                    tokens.append(Token('text', template[position:], line, col))
-                break
-
-            # Ordenar por posición de inicio
-            matches.sort(key=lambda x: x[0].start())
-            closest_match, match_type = matches[0]
-
+        for match in self.TOKEN_REGEX.finditer(template):
             # Agregar texto antes del match
-            if closest_match.start() > 0:
-                text_before = template[position:position + closest_match.start()]
+            if match.start() > position:
+                text_before = template[position:match.start()]
                 tokens.append(Token('text', text_before, line, col))
                 # Actualizar línea y columna
-                line += text_before.count('\n')
-                if '\n' in text_before:
-                    col = len(text_before.split('\n')[-1]) + 1
+                newlines = text_before.count('\n')
+                if newlines:
+                    line += newlines
+                    col = len(text_before) - text_before.rfind('\n')
                 else:
                     col += len(text_before)
 
-            # Procesar el match
+            # Procesar el match (grupos 2, 4, 5... son los de cada patrón)
+            match_type = match.lastgroup
+            groups = match.groups()
+
             if match_type == 'variable':
-                content = closest_match.group(1).strip()
+                content = groups[1].strip()
                 # Detectar si es una función (contiene paréntesis)
                 if '(' in content:
                     tokens.append(Token('function', content, line, col))
@@ -100,24 +89,28 @@ class TemplateParser:
                     tokens.append(Token('variable', content, line, col))
 
             elif match_type == 'block_start':
-                block_type = closest_match.group(1)  # 'if', 'for', 'switch', etc
-                block_content = closest_match.group(2).strip()
+                block_type = groups[3]  # 'if', 'for', 'switch', etc
+                block_content = groups[4].strip()
                 tokens.append(Token(f'start_{block_type}', block_content, line, col))
 
             elif match_type == 'block_end':
-                block_type = closest_match.group(1)
+                block_type = groups[6]
                 tokens.append(Token(f'end_{block_type}', '', line, col))
 
             elif match_type == 'else':
                 tokens.append(Token('else', '', line, col))
 
             elif match_type == 'elif':
-                condition = closest_match.group(1).strip()
+                condition = groups[9].strip()
                 tokens.append(Token('elif', condition, line, col))
 
             # Actualizar posición
-            position += closest_match.end()
-            col += len(closest_match.group(0))
+            position = match.end()
+            col += len(match.group(0))
+
+        # No hay más expresiones, agregar texto restante
+        if position < len(template):
+            tokens.append(Token('text', template[position:], line, col))
 
         return tokens
 
@@ -0,0 +1,24 @@
+from src.core.base_templates import (
+    get_base_templates,
+    get_template_params_for_file,
+    render,
+)
+
+
+class TestBaseTemplates:
+    def test_params_fill_every_placeholder(self):
+        for template in get_base_templates():
+            rendered = render(template["contenido"], get_template_params_for_file(template["nombre"]))
+            assert "{{" not in rendered
+
+    def test_render_leaves_unknown_placeholders(self):
+        contenido = get_base_templates()[0]["contenido"]
+        rendered = render(contenido, {"titulo": "Informe"})
+        assert "Informe" in rendered and "{{titulo}}" not in rendered
+        assert "{{empresa}}" in rendered
+
+    def test_presets_follow_keyword_precedence(self):
+        assert get_template_params_for_file("Reserva.html")["titulo"] == "Confirmación de Reserva"
+        # "manual" tiene prioridad sobre "reporte" aunque aparezca después
+        assert get_template_params_for_file("reporte_manual.md")["titulo"] == "Manual de Procedimientos"
+        assert get_template_params_for_file("otro.txt")["titulo"] == "Documento Base"
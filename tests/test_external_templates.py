@@ -0,0 +1,136 @@
+import json
+import os
+import shutil
+from src.core import external_templates
+from src.core.external_templates import ExternalTemplateLoader, get_external_template_params
+
+
+class TestExternalTemplateLoader:
+    def test_list_templates(self, temp_dir):
+        loader = ExternalTemplateLoader(temp_dir)
+        loader.save_template({'name': 'Report', 'description': 'HTML report'}, 'html')
+        loader.save_template({'name': 'Sheet'}, 'xlsx')
+        with open(os.path.join(temp_dir, 'html', 'notes.txt'), 'w') as f:
+            f.write('not a template')
+        with open(os.path.join(temp_dir, 'html', 'broken.json'), 'w') as f:
+            f.write('{')
+
+        html = loader.list_templates('html')
+        assert html == [{
+            'name': 'Report',
+            'extension': 'html',
+            'description': 'HTML report',
+            'file': os.path.join(temp_dir, 'html', 'Report.json')
+        }]
+        assert sorted((t['extension'], t['name']) for t in loader.list_templates()) == [('html', 'Report'), ('xlsx', 'Sheet')]
+        assert loader.list_templates('md') == []
+
+    def test_load_and_delete_template(self, temp_dir):
+        loader = ExternalTemplateLoader(temp_dir)
+        data = {'name': 'Doc', 'content': 'Hola {{nombre}}'}
+        assert loader.save_template(data, 'md')
+        assert loader.load_template('Doc', 'md') == data
+        with open(os.path.join(temp_dir, 'md', 'Doc.json'), encoding='utf-8') as f:
+            assert json.load(f) == data
+
+        assert loader.delete_template('Doc', 'md')
+        assert loader.load_template('Doc', 'md') is None
+        assert not loader.delete_template('Doc', 'md')
+
+    def test_load_template_returns_fresh_data(self, temp_dir):
+        loader = ExternalTemplateLoader(temp_dir)
+        loader.save_template({'name': 'Doc', 'version': '1.0', 'sheets': {'A': {}}}, 'md')
+        first = loader.load_template('Doc', 'md')
+        first['version'] = 'changed'
+        first['sheets']['A']['x'] = 1
+        assert loader.load_template('Doc', 'md') == {'name': 'Doc', 'version': '1.0', 'sheets': {'A': {}}}
+
+        loader.save_template({'name': 'Doc', 'version': '2.0'}, 'md')
+        assert loader.load_template('Doc', 'md')['version'] == '2.0'
+
+    def test_list_templates_cache(self, temp_dir):
+        loader = ExternalTemplateLoader(temp_dir)
+        loader.save_template({'name': 'Report', 'description': 'v1'}, 'html')
+        loader.list_templates('html')[0]['description'] = 'changed'
+        assert loader.list_templates('html')[0]['description'] == 'v1'
+
+        loader.save_template({'name': 'Report', 'description': 'v2'}, 'html')
+        loader.save_template({'name': 'Summary'}, 'html')
+        assert sorted((t['name'], t['description']) for t in loader.list_templates('html')) == [('Report', 'v2'), ('Summary', '')]
+
+    def test_list_templates_reads_summary_from_any_layout(self, temp_dir):
+        loader = ExternalTemplateLoader(temp_dir)
+        loader.save_template({'name': 'Informe "Q1"', 'description': 'Línea\tdos', 'sheets': {'A': {'name': 'nested'}}}, 'xlsx')
+        os.makedirs(os.path.join(temp_dir, 'md'))
+        # Minified, nested "name" first and no description
+        with open(os.path.join(temp_dir, 'md', 'plain.json'), 'w') as f:
+            f.write('{"meta": {"name": "nested"}, "content": "x"}')
+        # A valid-looking head does not list a file whose body is corrupt
+        with open(os.path.join(temp_dir, 'md', 'corrupt.json'), 'w') as f:
+            f.write('{\n  "name": "Corrupt",\n  "description": "d",\n  "content": ')
+
+        assert [(t['name'], t['description']) for t in loader.list_templates('xlsx')] == [('Informe "Q1"', 'Línea\tdos')]
+        assert [(t['name'], t['description']) for t in loader.list_templates('md')] == [('plain', '')]
+
+    def test_failed_save_keeps_existing_file(self, temp_dir):
+        loader = ExternalTemplateLoader(temp_dir)
+        assert loader.save_template({'name': 'Doc', 'version': '1.0'}, 'md')
+        assert not loader.save_template({'name': 'Doc', 'bad': object()}, 'md')
+
+        assert os.listdir(os.path.join(temp_dir, 'md')) == ['Doc.json']
+        assert loader.load_template('Doc', 'md') == {'name': 'Doc', 'version': '1.0'}
+
+    def test_save_template_recreates_removed_directory(self, temp_dir):
+        loader = ExternalTemplateLoader(temp_dir)
+        assert loader.save_template({'name': 'Doc'}, 'md')
+        shutil.rmtree(os.path.join(temp_dir, 'md'))
+
+        assert loader.save_template({'name': 'Doc'}, 'md')
+        assert loader.load_template('Doc', 'md') == {'name': 'Doc'}
+
+    def test_iter_templates_stops_early(self, temp_dir, monkeypatch):
+        loader = ExternalTemplateLoader(temp_dir)
+        for name in ('A', 'B', 'C'):
+            loader.save_template({'name': name}, 'md')
+        read = []
+        read_summary = external_templates._read_summary
+        monkeypatch.setattr(external_templates, '_read_summary', lambda path: read.append(path) or read_summary(path))
+
+        first = next(loader.iter_templates('md'))
+        assert first['name'] in ('A', 'B', 'C')
+        assert len(read) == 1
+
+        # Files already read are reused; the rest are read on the full listing
+        assert sorted(t['name'] for t in loader.list_templates('md')) == ['A', 'B', 'C']
+        assert len(read) == 3
+        assert len(loader.list_templates('md')) == 3
+        assert len(read) == 3
+
+    def test_list_templates_sees_files_edited_in_place(self, temp_dir):
+        loader = ExternalTemplateLoader(temp_dir)
+        loader.save_template({'name': 'Report', 'description': 'v1'}, 'html')
+        assert loader.list_templates('html')[0]['description'] == 'v1'
+
+        path = os.path.join(temp_dir, 'html', 'Report.json')
+        dir_mtime_ns = os.stat(os.path.dirname(path)).st_mtime_ns
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'name': 'Report', 'description': 'edited'}, f)
+        assert os.stat(os.path.dirname(path)).st_mtime_ns == dir_mtime_ns
+        assert loader.list_templates('html')[0]['description'] == 'edited'
+
+    def test_templates_dir_is_created_on_first_save(self, temp_dir):
+        templates_dir = os.path.join(temp_dir, 'nested', 'templates')
+        loader = ExternalTemplateLoader(templates_dir)
+        assert not os.path.exists(templates_dir)
+        assert loader.list_templates() == []
+        assert loader.load_template('Doc', 'md') is None
+
+        assert loader.save_template({'name': 'Doc'}, 'md')
+        assert [t['name'] for t in loader.list_templates()] == ['Doc']
+
+
+def test_external_template_params_follow_variant_priority():
+    assert get_external_template_params('reporte.md')['titulo'] == 'Documento Generado'
+    assert get_external_template_params('Customer_Dashboard.xlsx')['titulo'] == 'Dashboard Principal'
+    assert get_external_template_params('clientes_calculator.xlsx')['titulo'] == 'Calculadora Financiera'
+    assert get_external_template_params('cliente.docx')['titulo'] == 'Base de Datos de Clientes'
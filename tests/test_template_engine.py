@@ -0,0 +1,117 @@
+import functools
+import pytest
+from src.core.template_engine import TemplateRenderer
+from src.core.template_engine.compiler import compile_template, Op, OP_LITERAL, OP_FOR
+from src.core.template_engine.functions import TemplateFunctions
+
+
+def _count_calls(monkeypatch, method_name):
+    """Registrar los argumentos de cada llamada real a una función del template."""
+    original = getattr(TemplateFunctions, method_name)
+    calls = []
+
+    @functools.wraps(original)
+    def counting(self, *args):
+        calls.append(args)
+        return original(self, *args)
+
+    monkeypatch.setattr(TemplateFunctions, method_name, counting)
+    return calls
+
+
+class TestTemplateRenderer:
+    def test_render_variables_and_functions(self):
+        renderer = TemplateRenderer({'name': 'bob'})
+        rendered = renderer.render("Hola {{name}} - {{STRING.upper(name)}} - {{MATH.round(3.14159, 2)}}")
+        assert rendered == "Hola bob - BOB - 3.14"
+
+    def test_render_if_elif_else(self):
+        template = "{{#if x > 10}}big{{elif x > 1}}medium{{else}}small{{/if}}"
+        assert TemplateRenderer({'x': 20}).render(template) == "big"
+        assert TemplateRenderer({'x': 5}).render(template) == "medium"
+        assert TemplateRenderer({'x': 0}).render(template) == "small"
+
+    def test_render_for_loops(self):
+        renderer = TemplateRenderer({'items': ['a', 'b']})
+        assert renderer.render("{{#for i in 1..3}}{{i}},{{/for}}") == "1,2,3,"
+        assert renderer.render("{{#for k, v in items}}{{k}}={{v}};{{/for}}") == "0=a;1=b;"
+
+    def test_render_switch(self):
+        template = (
+            "{{#switch tipo}}"
+            "{{#case 'turismo'}}tours{{/case}}"
+            "{{#case 'IT'}}software{{/case}}"
+            "{{#default}}general{{/default}}"
+            "{{/switch}}"
+        )
+        assert TemplateRenderer({'tipo': 'IT'}).render(template) == "software"
+        assert TemplateRenderer({'tipo': 'otro'}).render(template) == "general"
+
+    def test_empty_tag_is_literal(self):
+        renderer = TemplateRenderer({'items': [1, 2]})
+        assert renderer.render("a{{}}b") == "a{{}}b"
+        assert renderer.render("{{#for i in items}}{{}}{{/for}}") == "{{}}{{}}"
+
+    def test_unbalanced_blocks_raise(self):
+        with pytest.raises(SyntaxError):
+            TemplateRenderer().render("{{#if x}}sin cierre")
+        with pytest.raises(SyntaxError):
+            TemplateRenderer().render("{{#if x}}{{/for}}")
+
+    def test_compiled_program_is_cached(self):
+        template = "{{#for item in items}}{{item}}{{/for}} fin"
+        program = TemplateRenderer.precompile(template)
+        assert compile_template(template) is program
+        assert [op.code for op in program] == [OP_FOR, OP_LITERAL]
+
+    def test_loop_invariant_calls_are_hoisted(self, monkeypatch):
+        calls = _count_calls(monkeypatch, 'string_upper')
+        template = "{{#for i in items}}{{STRING.upper(nombre)}}{{MATH.sum(i, 1)}};{{/for}} hoist"
+        renderer = TemplateRenderer({'nombre': 'acme', 'items': [1, 2, 3]})
+        assert renderer.render(template) == "ACME2.0;ACME3.0;ACME4.0; hoist"
+        # La llamada no depende de la variable del bucle: se evalúa una sola vez
+        assert calls == [('acme',)]
+
+    def test_pure_calls_are_memoized_per_render(self, monkeypatch):
+        calls = _count_calls(monkeypatch, 'string_upper')
+        renderer = TemplateRenderer({'flag': True, 'uno': 1})
+        template = "{{STRING.upper(flag)}} {{STRING.upper(uno)}} {{STRING.upper(flag)}} memo"
+        assert renderer.render(template) == "TRUE 1 TRUE memo"
+        assert calls == [(True,), (1,)]
+        # La memoización no sobrevive al render
+        assert renderer.render(template) == "TRUE 1 TRUE memo"
+        assert len(calls) == 4
+
+    def test_impure_calls_are_not_memoized(self):
+        first, second = TemplateRenderer().render("{{RANDOM.uuid()}} {{RANDOM.uuid()}}").split()
+        assert first != second
+
+    def test_render_precompiled(self):
+        program = TemplateRenderer.precompile("{{#if activo}}{{nombre}}{{else}}-{{/if}}")
+        assert TemplateRenderer({'activo': True, 'nombre': 'x'}).render_precompiled(program) == "x"
+        assert TemplateRenderer().render_precompiled(program, {'activo': False}) == "-"
+
+    def test_small_literal_ranges_are_unrolled(self):
+        assert compile_template("{{#for i in 1..3}}<{{i}}>{{/for}}") == (Op(OP_LITERAL, "<1><2><3>"),)
+        # Si el cuerpo usa la variable en una llamada, el for se conserva
+        assert compile_template("{{#for i in 1..3}}{{MATH.sum(i, 1)}}{{/for}}")[0].code == OP_FOR
+
+    def test_range_with_variable_bound(self):
+        renderer = TemplateRenderer({'equipo_size': 3})
+        assert renderer.render("{{#for i in 1..equipo_size}}{{i}}{{/for}}") == "123"
+
+    def test_program_runs_generated_function(self):
+        template = "{{#for x in items}}{{#if x > 1}}{{x}}{{/if}}{{/for}}"
+        program = TemplateRenderer.precompile(template)
+        assert callable(program.run)
+        renderer = TemplateRenderer({'items': [1, 2, 3], 'x': 'antes'})
+        assert renderer.render_precompiled(program) == "23"
+        assert renderer.context['x'] == 'antes'
+
+    def test_render_params_do_not_leak_between_renders(self):
+        renderer = TemplateRenderer({'empresa': 'Acme'})
+        template = "{{empresa}}-{{#if plan == 'premium'}}P{{else}}B{{/if}}"
+        assert renderer.render(template, {'plan': 'premium'}) == "Acme-P"
+        assert renderer.render(template) == "Acme-B"
+        assert renderer.render(template, {'empresa': 'Otra'}) == "Otra-B"
+        assert renderer.context == {'empresa': 'Acme'}